@@ -1,10 +1,37 @@
-import asyncio
-import os
 from dotenv import load_dotenv
+from src.agents.tavily.tavily_search_agent import TavilySearchAgent
 from src.mcp_servers.tavily_search.client import TavilySearchClient
 
+try:
+    from uvloop import run
+except ImportError:
+    from asyncio import run
+
 load_dotenv()
 
-tavily_client = TavilySearchClient()
+async def search_client_smoke_test():
+    tavily_client = TavilySearchClient()
+    result = await tavily_client.search(query="OpenAI 2025 August latest open source model")
+    assert result.get("results"), "Tavily search returned no results"
+    print(f"[client] {len(result['results'])} results")
+
+async def main():
+    await search_client_smoke_test()
+
+    agent = await TavilySearchAgent.create()
+    queries = [
+        "OpenAI 2025 August latest open source model",
+        "Latest AI trends as of August 2025",
+        "Latest news as of August 29, 2025",
+    ]
+    try:
+        responses = await agent.abatch(queries=queries, max_concurrency=3)
+    finally:
+        await agent.aclose()
+
+    assert len(responses) == len(queries)
+    for query, response in zip(queries, responses):
+        assert response, f"Empty response for query: {query}"
+        print(f"[agent] {query}\n{response}\n")
 
-result = asyncio.run(tavily_client.search(query="OpenAI 2025 August latest open source model"))
\ No newline at end of file
+run(main())
@@ -2,12 +2,101 @@
 Base Class for Agent
 """
 
+import asyncio
+import time
 from abc import ABC, abstractmethod
-from typing import ClassVar
+from typing import Any, Callable, ClassVar
+
+import httpx
 
 from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.runnables import RunnableBinding, RunnableConfig
 from langchain_openai import ChatOpenAI
 from langgraph.graph import StateGraph
+from langgraph.graph.state import CompiledStateGraph
+
+# -----------------------------------------------------------
+# Shared HTTP Connection Pool
+# -----------------------------------------------------------
+HTTP_LIMITS = httpx.Limits(
+    max_keepalive_connections=20,
+    max_connections=100,
+    keepalive_expiry=30.0,
+)
+# HTTP/2 multiplexes concurrent requests on one connection (requires httpx[http2])
+try:
+    import h2  # noqa: F401
+    HTTP2_ENABLED = True
+except ImportError:
+    HTTP2_ENABLED = False
+
+HTTP_TRANSPORT = httpx.AsyncHTTPTransport(limits=HTTP_LIMITS, http2=HTTP2_ENABLED)
+SHARED_HTTP_CLIENT = httpx.AsyncClient(transport=HTTP_TRANSPORT)
+
+class _BorrowedTransport(httpx.AsyncBaseTransport):
+    """
+    Transport delegating to the shared connection pool.
+
+    Closing the borrowing client does not close the shared pool.
+    """
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await HTTP_TRANSPORT.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        pass
+
+def create_shared_http_client(
+    headers: dict[str, str] | None = None,
+    timeout: httpx.Timeout | None = None,
+    auth: httpx.Auth | None = None,
+) -> httpx.AsyncClient:
+    """
+    httpx Client Factory for MCP transports using the shared connection pool
+
+    Args:
+        headers: dict[str, str] | None = None
+        timeout: httpx.Timeout | None = None
+        auth: httpx.Auth | None = None
+    """
+
+    return httpx.AsyncClient(
+        headers=headers,
+        timeout=timeout or httpx.Timeout(30.0),
+        auth=auth,
+        follow_redirects=True,
+        transport=_BorrowedTransport(),
+    )
+
+async def aclose_shared_http_client() -> None:
+    """
+    Close the shared connection pool on application shutdown
+    """
+
+    await SHARED_HTTP_CLIENT.aclose()
+
+# -----------------------------------------------------------
+# Instance-agnostic Node Dispatch
+# -----------------------------------------------------------
+AGENT_CONFIG_KEY = "__agent__"
+
+def agent_node(method_name: str) -> Callable:
+    """
+    Create Node which re-dispatches to the agent instance bound in the run config
+
+    Compiled graphs are shared across agent instances of the same shape,
+    so nodes must not capture a bound method of the building instance.
+
+    Args:
+        method_name: str
+    """
+
+    async def _node(state: dict, config: RunnableConfig) -> dict:
+        agent = config["configurable"][AGENT_CONFIG_KEY]
+        return await getattr(agent, method_name)(state)
+
+    _node.__name__ = method_name
+    return _node
 
 class BaseLangGraphAgent(ABC):
     """
@@ -16,6 +105,13 @@ class BaseLangGraphAgent(ABC):
 
     NODE_NAMES:ClassVar[dict[str, str]] = {}
 
+    # compiled graphs shared by every agent instance with the same shape
+    _compiled_graph_cache:ClassVar[dict[tuple, CompiledStateGraph]] = {}
+
+    # mcp tool manifests shared by every agent instance connected to the same server
+    _tool_cache:ClassVar[dict[tuple, tuple[float, list]]] = {}
+    _tool_cache_locks:ClassVar[dict[tuple, asyncio.Lock]] = {}
+
     def __init__(
         self,
         model: BaseChatModel | ChatOpenAI,
@@ -42,6 +138,7 @@ class BaseLangGraphAgent(ABC):
         self.output_schema = output_schema
         self.agent_name = agent_name
         self.auto_build = auto_build
+        self.graph = None
 
         # auto build graph when subclass graph need to be late-build
         if self.auto_build:
@@ -61,6 +158,29 @@ class BaseLangGraphAgent(ABC):
         if key not in self.NODE_NAMES:
             raise ValueError(f"Node Name {key} not found in {self.NODE_NAMES}")
         return self.NODE_NAMES[key]
+
+    async def get_cached_tools(
+        self,
+        mcp_client: Any,
+        cache_key: tuple,
+        ttl_seconds: float = 300.0,
+    ) -> list:
+        """
+        Load MCP Tools once per server and share them across agent instances
+
+        Args:
+            mcp_client: MultiServerMCPClient
+            cache_key: tuple identifying mcp server url and connection config
+            ttl_seconds: float = 300.0 (tool manifest is reloaded after expiry)
+        """
+
+        async with self._tool_cache_locks.setdefault(cache_key, asyncio.Lock()):
+            cached = self._tool_cache.get(cache_key)
+            if cached is None or time.monotonic() - cached[0] > ttl_seconds:
+                cached = (time.monotonic(), await mcp_client.get_tools())
+                self._tool_cache[cache_key] = cached
+
+        return cached[1]
     
     # -----------------------------------------------------------
     # Shoul Implement before using Agent
@@ -88,18 +208,58 @@ class BaseLangGraphAgent(ABC):
     # -----------------------------------------------------------
     # Build Graph
     # -----------------------------------------------------------
-    def build_graph(self):
+    def _graph_cache_key(self) -> tuple:
         """
-        Build Graph for LangGraph Agent
+        Cache Key of Compiled Graph
+
+        Graph shape is determined by agent class, schemas and node names.
         """
 
-        _graph = StateGraph(
-            state_schema=self.state_schema,
-            input_schema=self.input_schema,
-            output_schema=self.output_schema,
+        return (
+            self.__class__,
+            self.state_schema,
+            self.input_schema,
+            self.output_schema,
+            tuple(sorted(self.NODE_NAMES.items())),
         )
 
-        self._init_nodes(_graph)
-        self._init_edges(_graph)
+    def build_graph(self, force_rebuild: bool = False) -> RunnableBinding:
+        """
+        Build Graph for LangGraph Agent
+
+        Graph is built once per instance; later calls return it unless
+        `force_rebuild` is True. Compiled graph is reused across instances
+        with the same cache key and bound to this instance with `RunnableBinding`,
+        which merges the agent into the caller's `configurable` on every call
+        (`CompiledStateGraph.with_config` would be replaced by a caller config).
+        Nodes should be registered with `agent_node` so they dispatch to the
+        instance that runs the graph.
+
+        Args:
+            force_rebuild: bool = False (recompile even if graph is built or cached)
+        """
 
-        self.graph = _graph.compile()
\ No newline at end of file
+        if self.graph is not None and not force_rebuild:
+            return self.graph
+
+        key = self._graph_cache_key()
+        compiled_graph = None if force_rebuild else self._compiled_graph_cache.get(key)
+
+        if compiled_graph is None:
+            _graph = StateGraph(
+                state_schema=self.state_schema,
+                input_schema=self.input_schema,
+                output_schema=self.output_schema,
+            )
+
+            self._init_nodes(_graph)
+            self._init_edges(_graph)
+
+            compiled_graph = _graph.compile()
+            self._compiled_graph_cache[key] = compiled_graph
+
+        self.graph = RunnableBinding(
+            bound=compiled_graph,
+            config={"configurable": {AGENT_CONFIG_KEY: self}},
+        )
+        return self.graph
\ No newline at end of file
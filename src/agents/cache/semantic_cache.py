@@ -0,0 +1,652 @@
+"""
+Semantic Response Cache
+"""
+
+import asyncio
+import hashlib
+import heapq
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable
+
+import numpy as np
+
+from langchain_core.load import dumpd, load
+from langchain_core.messages import BaseMessage
+
+# -----------------------------------------------------------
+# Exact-match Cache Key
+# -----------------------------------------------------------
+def make_exact_key(
+    model_name: str | None,
+    messages: Iterable[BaseMessage],
+    tool_names: Iterable[str],
+) -> str:
+    """
+    SHA-256 Cache Key over model id, message types / contents and tool set
+
+    Message ids are excluded since they differ on every call.
+
+    Args:
+        model_name: Model id of chat model
+        messages: Input messages
+        tool_names: Names of tools bound to agent
+    """
+
+    payload = {
+        "model" : model_name,
+        "messages" : [(message.type, message.content) for message in messages],
+        "tools" : sorted(tool_names),
+    }
+    return hashlib.sha256(
+        json.dumps(payload, sort_keys=True, default=str).encode()
+    ).hexdigest()
+
+# -----------------------------------------------------------
+# Embedding Micro-Batcher
+# -----------------------------------------------------------
+class EmbedBatcher:
+    """
+    Coalesce concurrent single-text embed requests into batched forward passes
+
+    Requests arriving within `window_seconds` of the first queued request are
+    encoded together (up to `max_batch_size`) in a worker thread.
+    """
+
+    def __init__(
+        self,
+        embed_fn: Callable[[list[str]], np.ndarray],
+        window_seconds: float = 0.005,
+        max_batch_size: int = 64,
+    ) -> None:
+        """
+        Initialize Embed Batcher
+
+        Args:
+            embed_fn: Batched embedding function returning (N, d) matrix
+            window_seconds: Time to wait for more requests after the first one
+            max_batch_size: Maximum number of texts per forward pass
+        """
+
+        self.embed_fn = embed_fn
+        self.window_seconds = window_seconds
+        self.max_batch_size = max_batch_size
+
+        self._queue: asyncio.Queue | None = None
+        self._worker: asyncio.Task | None = None
+
+    async def embed(self, text: str) -> np.ndarray:
+        """
+        Embed single text through the batched backend, returning (1, d) row vector
+
+        Args:
+            text: Text to embed
+        """
+
+        if self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._run())
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((text, future))
+        return await future
+
+    async def aclose(self) -> None:
+        """
+        Stop background worker
+        """
+
+        if self._worker is not None:
+            self._worker.cancel()
+            self._worker = None
+
+    async def _run(self) -> None:
+        while True:
+            batch = [await self._queue.get()]
+            await asyncio.sleep(self.window_seconds)
+            while len(batch) < self.max_batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+
+            try:
+                vectors = await asyncio.to_thread(self.embed_fn, [text for text, _ in batch])
+            except Exception as error:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(error)
+                continue
+
+            for (_, future), vector in zip(batch, vectors):
+                if not future.done():
+                    future.set_result(vector.reshape(1, -1))
+
+# -----------------------------------------------------------
+# Long-Term Store (on-disk, LFU)
+# -----------------------------------------------------------
+class LongTermCacheStore:
+    """
+    Durable cache tier backed by SQLite rows and a FAISS index persisted next to the database
+
+    Least frequently used entries are evicted beyond `maxsize`.
+    `find` / `persist` / `close` hold a lock so they can run in worker threads.
+    """
+
+    def __init__(self, path: str, dimension: int, maxsize: int = 10000) -> None:
+        """
+        Initialize Long-Term Cache Store
+
+        Args:
+            path: SQLite database path (FAISS index is stored at `{path}.faiss`)
+            dimension: Embedding dimension
+            maxsize: Maximum number of persisted entries (LFU eviction)
+        """
+
+        import faiss
+
+        self._faiss = faiss
+        self.path = path
+        self.index_path = f"{path}.faiss"
+        self.dimension = dimension
+        self.maxsize = maxsize
+
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS entries (
+                id INTEGER PRIMARY KEY,
+                query TEXT UNIQUE NOT NULL,
+                embedding BLOB NOT NULL,
+                response TEXT NOT NULL,
+                freq INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+            """
+        )
+
+        count = self.conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+        self.index = faiss.read_index(self.index_path) if os.path.exists(self.index_path) else None
+        if self.index is None or self.index.ntotal != count:
+            self._rebuild_index()
+
+    def _rebuild_index(self) -> None:
+        self.index = self._faiss.IndexIDMap(self._faiss.IndexFlatIP(self.dimension))
+        rows = self.conn.execute("SELECT id, embedding FROM entries").fetchall()
+        if rows:
+            ids = np.array([row[0] for row in rows], dtype=np.int64)
+            vectors = np.stack([np.frombuffer(row[1], dtype=np.float32) for row in rows])
+            self.index.add_with_ids(np.ascontiguousarray(vectors), ids)
+
+    def _delete(self, entry_id: int) -> None:
+        self.index.remove_ids(np.array([entry_id], dtype=np.int64))
+        self.conn.execute("DELETE FROM entries WHERE id = ?", (entry_id,))
+
+    def search(self, vector: np.ndarray) -> tuple[int, float] | None:
+        """
+        Return (entry id, cosine similarity) of the nearest persisted query
+        """
+
+        if self.index.ntotal == 0:
+            return None
+
+        scores, ids = self.index.search(vector, 1)
+        if int(ids[0][0]) == -1:
+            return None
+        return int(ids[0][0]), float(scores[0][0])
+
+    def get(self, entry_id: int, ttl_seconds: float | None = None) -> tuple[str, Any, float] | None:
+        """
+        Return (query, response, created_at) of entry and record the access
+
+        Expired entries are deleted and None is returned.
+        """
+
+        row = self.conn.execute(
+            "SELECT query, response, created_at FROM entries WHERE id = ?", (entry_id,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        query, response, created_at = row
+        if ttl_seconds is not None and time.time() - created_at > ttl_seconds:
+            self._delete(entry_id)
+            self.conn.commit()
+            return None
+
+        self.conn.execute(
+            "UPDATE entries SET freq = freq + 1, last_access = ? WHERE id = ?",
+            (time.time(), entry_id),
+        )
+        self.conn.commit()
+        return query, load(json.loads(response)), created_at
+
+    def upsert(self, query: str, vector: np.ndarray, response: Any, hits: int, created_at: float) -> None:
+        """
+        Insert entry or add `hits` to frequency of the already persisted query
+        """
+
+        serialized = json.dumps(dumpd(response))
+        row = self.conn.execute("SELECT id FROM entries WHERE query = ?", (query,)).fetchone()
+
+        if row is not None:
+            self.conn.execute(
+                "UPDATE entries SET response = ?, freq = freq + ?, created_at = ?, last_access = ? WHERE id = ?",
+                (serialized, hits, created_at, time.time(), row[0]),
+            )
+            return
+
+        cursor = self.conn.execute(
+            "INSERT INTO entries (query, embedding, response, freq, created_at, last_access) VALUES (?, ?, ?, ?, ?, ?)",
+            (query, vector.astype(np.float32).tobytes(), serialized, hits, created_at, time.time()),
+        )
+        self.index.add_with_ids(vector.reshape(1, -1), np.array([cursor.lastrowid], dtype=np.int64))
+
+        overflow = self.index.ntotal - self.maxsize
+        if overflow > 0:
+            victims = self.conn.execute(
+                "SELECT id FROM entries ORDER BY freq ASC, last_access ASC LIMIT ?", (overflow,)
+            ).fetchall()
+            for (victim_id,) in victims:
+                self._delete(victim_id)
+
+    def flush(self) -> None:
+        """
+        Commit database and persist FAISS index to disk
+        """
+
+        self.conn.commit()
+        self._faiss.write_index(self.index, self.index_path)
+
+    def find(
+        self,
+        vector: np.ndarray,
+        threshold: float,
+        ttl_seconds: float | None = None,
+    ) -> tuple[str, Any, float] | None:
+        """
+        Return (query, response, created_at) of nearest persisted query at or above `threshold`
+        """
+
+        with self._lock:
+            found = self.search(vector)
+            if found is None or found[1] < threshold:
+                return None
+            return self.get(found[0], ttl_seconds=ttl_seconds)
+
+    def persist(self, rows: list[tuple[str, np.ndarray, Any, int, float]]) -> None:
+        """
+        Upsert (query, vector, response, hits, created_at) rows and flush to disk
+        """
+
+        with self._lock:
+            for row in rows:
+                self.upsert(*row)
+            self.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            self.flush()
+            self.conn.close()
+
+# -----------------------------------------------------------
+# Semantic Response Cache
+# -----------------------------------------------------------
+# above this many in-memory entries, exact flat search is replaced by HNSW graph search
+HNSW_MIN_ENTRIES = 10000
+# number of vectors the int8 scalar quantizer is trained on before replacing the float32 index
+# (capped at `maxsize` so small caches still migrate once full)
+SQ_TRAIN_SIZE = 4096
+
+@dataclass(slots=True)
+class _CacheEntry:
+    """
+    In-memory (MTM) cache entry
+    """
+
+    query: str
+    response: Any
+    vector: np.ndarray | None # None once the index holds int8 codes (decoded on demand)
+    created_at: float
+    hits: int = 0
+
+class SemanticResponseCache:
+    """
+    Multi-tier Response Cache
+
+    - L1: exact match on hashed message payload (dict lookup)
+    - MTM: in-memory, LRU, cosine similarity of query embeddings (FAISS search)
+    - LTM: on-disk, LFU, SQLite + FAISS (optional, enabled by `ltm_path`)
+
+    Every `consolidate_every` inserts, the most hit MTM entries are promoted
+    to LTM and the LRU tail of MTM is evicted. LTM hits are promoted back to MTM.
+
+    MTM vectors are float32 rows of one contiguous FAISS matrix searched with
+    SIMD inner products; caches larger than `HNSW_MIN_ENTRIES` use an HNSW index.
+    With `quantize`, the flat index migrates to int8 scalar quantization once
+    `min(SQ_TRAIN_SIZE, maxsize)` vectors are available for training; entries then
+    drop their float32 copy, so MTM vectors take a quarter of the memory
+    (the embedding memo of size `embedding_cache_size` stays float32).
+    """
+
+    def __init__(
+        self,
+        model_name: str = "all-MiniLM-L6-v2",
+        threshold: float = 0.87,
+        maxsize: int = 1024,
+        ttl_seconds: float | None = 3600.0,
+        embedding_cache_size: int = 4096,
+        ltm_path: str | None = None,
+        ltm_maxsize: int = 10000,
+        consolidate_every: int = 100,
+        consolidate_top_k: int = 16,
+        quantize: bool = False,
+    ) -> None:
+        """
+        Initialize Semantic Response Cache
+
+        Args:
+            model_name: Sentence Transformer model used to embed queries
+            threshold: Minimum cosine similarity regarded as cache hit
+            maxsize: Maximum number of in-memory entries (LRU eviction)
+            ttl_seconds: Lifetime of cached entry (None for no expiry)
+            embedding_cache_size: Maximum number of memoized query embeddings
+            ltm_path: SQLite path of long-term tier (None disables it)
+            ltm_maxsize: Maximum number of long-term entries (LFU eviction)
+            consolidate_every: Number of inserts between MTM -> LTM consolidations
+            consolidate_top_k: Number of entries promoted and evicted per consolidation
+            quantize: Store in-memory vectors as int8 (flat index only)
+        """
+
+        import faiss
+        from sentence_transformers import SentenceTransformer
+
+        self.threshold = threshold
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self.embedding_cache_size = embedding_cache_size
+        self.consolidate_every = consolidate_every
+        self.consolidate_top_k = consolidate_top_k
+
+        self.encoder = SentenceTransformer(model_name)
+        self.dimension = self.encoder.get_sentence_embedding_dimension()
+
+        self._faiss = faiss
+        self.use_hnsw = maxsize > HNSW_MIN_ENTRIES
+        self.quantize = quantize and not self.use_hnsw
+        self._quantized = False
+        self._sq_train_size = min(SQ_TRAIN_SIZE, maxsize)
+        self.index = self._create_index()
+        # evicted ids still present in index (HNSW does not support removal)
+        self._tombstones = 0
+        # entry id -> entry, ordered from least to most recently used
+        self.entries: OrderedDict[int, _CacheEntry] = OrderedDict()
+        self._next_id = 0
+        self._inserts_since_consolidation = 0
+
+        self.ltm = LongTermCacheStore(ltm_path, self.dimension, ltm_maxsize) if ltm_path else None
+
+        # exact key -> (response, created_at), ordered from least to most recently used
+        self._exact: OrderedDict[str, tuple[Any, float]] = OrderedDict()
+
+        # raw text -> embedding, ordered from least to most recently used
+        self._embeddings: OrderedDict[str, np.ndarray] = OrderedDict()
+        self.batcher = EmbedBatcher(self._embed_many)
+
+    # -----------------------------------------------------------
+    # Utility Methods
+    # -----------------------------------------------------------
+    def _embed_many(self, texts: list[str]) -> np.ndarray:
+        """
+        Embed texts into (N, d) L2-normalized float32 matrix
+
+        Embeddings are memoized by raw text; only cache misses are encoded,
+        in a single batched forward pass.
+        """
+
+        missing = [text for text in dict.fromkeys(texts) if text not in self._embeddings]
+        if missing:
+            vectors = self.encoder.encode(missing, batch_size=64, normalize_embeddings=True)
+            for text, vector in zip(missing, np.asarray(vectors, dtype=np.float32)):
+                self._embeddings[text] = vector
+
+        rows = []
+        for text in texts:
+            self._embeddings.move_to_end(text)
+            rows.append(self._embeddings[text])
+
+        while len(self._embeddings) > self.embedding_cache_size:
+            self._embeddings.popitem(last=False)
+
+        return np.ascontiguousarray(np.stack(rows), dtype=np.float32)
+
+    def _create_index(self) -> Any:
+        """
+        Create FAISS index where inner product over L2-normalized vectors equals cosine similarity
+        """
+
+        if self.use_hnsw:
+            base_index = self._faiss.IndexHNSWFlat(self.dimension, 32, self._faiss.METRIC_INNER_PRODUCT)
+        elif self._quantized:
+            base_index = self._faiss.IndexScalarQuantizer(
+                self.dimension,
+                self._faiss.ScalarQuantizer.QT_8bit,
+                self._faiss.METRIC_INNER_PRODUCT,
+            )
+            # IndexIDMap2 keeps an id -> row map so int8 codes can be decoded by entry id
+            return self._faiss.IndexIDMap2(base_index)
+        else:
+            base_index = self._faiss.IndexFlatIP(self.dimension)
+        return self._faiss.IndexIDMap(base_index)
+
+    def _rebuild_index(self) -> None:
+        self.index = self._create_index()
+        self._tombstones = 0
+        if self.entries:
+            ids = np.fromiter(self.entries.keys(), dtype=np.int64, count=len(self.entries))
+            vectors = np.ascontiguousarray(
+                np.vstack([entry.vector for entry in self.entries.values()]), dtype=np.float32
+            )
+            if not self.index.is_trained:
+                self.index.train(vectors)
+            self.index.add_with_ids(vectors, ids)
+
+    def _is_expired(self, created_at: float) -> bool:
+        return self.ttl_seconds is not None and time.time() - created_at > self.ttl_seconds
+
+    def _evict(self, entry_id: int) -> None:
+        del self.entries[entry_id]
+        if not self.use_hnsw:
+            self.index.remove_ids(np.array([entry_id], dtype=np.int64))
+            return
+
+        self._tombstones += 1
+        if self._tombstones > len(self.entries):
+            self._rebuild_index()
+
+    def _insert_entry(self, entry: _CacheEntry) -> None:
+        while len(self.entries) >= self.maxsize:
+            self._evict(next(iter(self.entries)))
+
+        entry_id = self._next_id
+        self._next_id += 1
+
+        self.index.add_with_ids(entry.vector, np.array([entry_id], dtype=np.int64))
+        self.entries[entry_id] = entry
+
+        if self._quantized:
+            entry.vector = None
+        # migrate float32 index to int8 codes once enough vectors exist to train on
+        elif self.quantize and len(self.entries) >= self._sq_train_size:
+            self._quantized = True
+            self._rebuild_index()
+            for cached_entry in self.entries.values():
+                cached_entry.vector = None
+
+    def _entry_vector(self, entry_id: int, entry: _CacheEntry) -> np.ndarray:
+        if entry.vector is not None:
+            return entry.vector
+        # decode int8 codes (approximate float32 embedding)
+        return self.index.reconstruct(entry_id).reshape(1, -1)
+
+    def _insert_exact(self, exact_key: str, response: Any, created_at: float) -> None:
+        self._exact[exact_key] = (response, created_at)
+        self._exact.move_to_end(exact_key)
+        while len(self._exact) > self.maxsize:
+            self._exact.popitem(last=False)
+
+    def _lookup_exact(self, exact_key: str) -> Any | None:
+        cached = self._exact.get(exact_key)
+        if cached is None:
+            return None
+
+        response, created_at = cached
+        if self._is_expired(created_at):
+            del self._exact[exact_key]
+            return None
+
+        self._exact.move_to_end(exact_key)
+        return response
+
+    def _lookup_mtm(self, vector: np.ndarray) -> _CacheEntry | None:
+        if self.index.ntotal == 0:
+            return None
+
+        # over-fetch when evicted ids may still occupy nearest slots
+        k = 1 if self._tombstones == 0 else min(self.index.ntotal, 8)
+        scores, ids = self.index.search(vector, k)
+
+        for score, entry_id in zip(scores[0].tolist(), ids[0].tolist()):
+            if entry_id in self.entries:
+                break
+        else:
+            return None
+        if score < self.threshold:
+            return None
+
+        entry = self.entries[entry_id]
+        if self._is_expired(entry.created_at):
+            self._evict(entry_id)
+            return None
+
+        entry.hits += 1
+        self.entries.move_to_end(entry_id)
+        return entry
+
+    async def _lookup_ltm(self, vector: np.ndarray) -> _CacheEntry | None:
+        if self.ltm is None:
+            return None
+
+        # SQLite / FAISS disk access runs off the event loop
+        stored = await asyncio.to_thread(self.ltm.find, vector, self.threshold, self.ttl_seconds)
+        if stored is None:
+            return None
+
+        # promote long-term hit back into memory
+        query, response, created_at = stored
+        entry = _CacheEntry(query=query, response=response, vector=vector, created_at=created_at, hits=1)
+        self._insert_entry(entry)
+        return entry
+
+    # -----------------------------------------------------------
+    # Lookup / Insert / Consolidate
+    # -----------------------------------------------------------
+    async def lookup(self, query: str, exact_key: str | None = None) -> Any | None:
+        """
+        Return cached response of the exact or most similar query, or None on miss
+
+        Lookup order is L1 -> MTM -> LTM. Similarity hits are backfilled into L1
+        so the next identical request skips embedding.
+
+        Args:
+            query: User Query
+            exact_key: Key from `make_exact_key` (L1 skipped if None)
+        """
+
+        if exact_key is not None:
+            response = self._lookup_exact(exact_key)
+            if response is not None:
+                return response
+
+        if self.index.ntotal == 0 and self.ltm is None:
+            return None
+
+        vector = await self.batcher.embed(query)
+        entry = self._lookup_mtm(vector) or await self._lookup_ltm(vector)
+        if entry is None:
+            return None
+
+        if exact_key is not None:
+            self._insert_exact(exact_key, entry.response, entry.created_at)
+        return entry.response
+
+    async def insert(self, query: str, response: Any, exact_key: str | None = None) -> None:
+        """
+        Insert response of query into cache
+
+        Args:
+            query: User Query
+            response: Response to cache
+            exact_key: Key from `make_exact_key` (L1 skipped if None)
+        """
+
+        vector = await self.batcher.embed(query)
+
+        created_at = time.time()
+        self._insert_entry(
+            _CacheEntry(query=query, response=response, vector=vector, created_at=created_at)
+        )
+        if exact_key is not None:
+            self._insert_exact(exact_key, response, created_at)
+
+        self._inserts_since_consolidation += 1
+        if self._inserts_since_consolidation >= self.consolidate_every:
+            await self.consolidate()
+
+    def _take_hot_entries(self) -> list[tuple[str, np.ndarray, Any, int, float]]:
+        """
+        Collect most hit MTM entries as LTM rows and evict LRU tail of MTM
+        """
+
+        self._inserts_since_consolidation = 0
+        hot_entries = heapq.nlargest(
+            self.consolidate_top_k,
+            ((entry_id, entry) for entry_id, entry in self.entries.items() if entry.hits > 0),
+            key=lambda item: item[1].hits,
+        )
+        rows = []
+        for entry_id, entry in hot_entries:
+            vector = self._entry_vector(entry_id, entry)
+            rows.append((entry.query, vector, entry.response, entry.hits, entry.created_at))
+            entry.hits = 0
+
+        for entry_id in list(self.entries)[:self.consolidate_top_k]:
+            self._evict(entry_id)
+
+        return rows
+
+    async def consolidate(self) -> None:
+        """
+        Promote most hit MTM entries to LTM and evict LRU tail of MTM
+
+        In-memory bookkeeping runs on the event loop; SQLite / FAISS writes run in a worker thread.
+        """
+
+        if self.ltm is None:
+            self._inserts_since_consolidation = 0
+            return
+
+        await asyncio.to_thread(self.ltm.persist, self._take_hot_entries())
+
+    def close(self) -> None:
+        """
+        Consolidate and persist long-term tier (blocking, call from a worker thread in async code)
+        """
+
+        if self.ltm is not None:
+            self.ltm.persist(self._take_hot_entries())
+            self.ltm.close()
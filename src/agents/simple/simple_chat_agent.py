@@ -2,7 +2,13 @@
 Simple Chat Agent
 """
 
-from src.agents.base.base_agent import BaseLangGraphAgent
+import asyncio
+import hashlib
+import json
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+from src.agents.base.base_agent import BaseLangGraphAgent, agent_node
 
 from typing import ClassVar, TypedDict
 from typing_extensions import Annotated
@@ -13,6 +19,13 @@ from langchain_core.messages import HumanMessage, AIMessage, BaseMessage
 
 from langgraph.graph import StateGraph, START, END, add_messages
 
+# -----------------------------------------------------------
+# Deterministic Generation Cache
+# -----------------------------------------------------------
+# message payload hash -> generated content, for temperature=0 calls only
+_L1_CACHE: OrderedDict[str, str] = OrderedDict()
+_L1_CACHE_MAXSIZE = 10000
+
 # -----------------------------------------------------------
 # Schema
 # -----------------------------------------------------------
@@ -30,11 +43,17 @@ class OutputSchema(TypedDict):
 
     generation: Annotated[str, "Generated Response"]
 
-class StateSchema(InputSchema, OutputSchema):
+@dataclass(slots=True, kw_only=True)
+class StateSchema:
     """
     State Schema for Simple LangGraph Chat Agent
+
+    Slotted dataclass instead of TypedDict for cheaper attribute access in nodes.
     """
-    messages: Annotated[list[BaseMessage], add_messages]
+
+    query: Annotated[str, "User Query"] = ""
+    generation: Annotated[str, "Generated Response"] = ""
+    messages: Annotated[list[BaseMessage], add_messages] = field(default_factory=list)
 
 
 # -----------------------------------------------------------
@@ -74,7 +93,7 @@ class SimpleLangGraphChatAgent(BaseLangGraphAgent):
         Initialize Nodes for Simple LangGraph Chat Agent
         """
 
-        graph.add_node(self.NODE_NAMES["GENERATE"], self._generate_node)
+        graph.add_node(self.NODE_NAMES["GENERATE"], agent_node("_generate_node"))
     
     def _init_edges(self, graph: StateGraph) -> None:
         """
@@ -88,16 +107,59 @@ class SimpleLangGraphChatAgent(BaseLangGraphAgent):
     # -----------------------------------------------------------
     # Node Functions
     # -----------------------------------------------------------
-    def _generate_node(self, state: dict) -> dict:
+    async def _generate_node(self, state: StateSchema) -> dict:
         """
         Generate Node for Simple LangGraph Chat Agent
         """
 
-        human_message = HumanMessage(content=state["query"])
-        ai_message = self.model.invoke([human_message])
+        human_message = HumanMessage(content=state.query)
+        new_messages = [human_message]
+
+        # temperature=0 output is deterministic w.r.t. model and messages
+        cache_key = None
+        if getattr(self.model, "temperature", None) == 0:
+            # only type and content; message ids are random per call
+            payload = {
+                "model" : getattr(self.model, "model_name", None),
+                "messages" : [(human_message.type, human_message.content)],
+            }
+            cache_key = hashlib.sha256(
+                json.dumps(payload, sort_keys=True, default=str).encode()
+            ).hexdigest()
+
+            cached_content = _L1_CACHE.get(cache_key)
+            if cached_content is not None:
+                _L1_CACHE.move_to_end(cache_key)
+                new_messages.append(AIMessage(content=cached_content))
+                return {
+                    "generation" : cached_content,
+                    "messages" : new_messages,
+                }
+
+        ai_message = await self.model.ainvoke((human_message,))
+        new_messages.append(ai_message)
+
+        if cache_key is not None:
+            _L1_CACHE[cache_key] = ai_message.content
+            if len(_L1_CACHE) > _L1_CACHE_MAXSIZE:
+                _L1_CACHE.popitem(last=False)
 
         return {
-            "query" : state["query"],
             "generation" : ai_message.content,
-            "messages" : [human_message, ai_message]
-        }
\ No newline at end of file
+            "messages" : new_messages,
+        }
+
+    # -----------------------------------------------------------
+    # Batch Query
+    # -----------------------------------------------------------
+    async def abatch_query(self, queries: list[str]) -> list[dict]:
+        """
+        Run multiple queries concurrently on the compiled graph
+
+        Args:
+            queries: list[str]
+        """
+
+        return await asyncio.gather(
+            *(self.graph.ainvoke({"query": query}) for query in queries)
+        )
@@ -1,19 +1,27 @@
 """
 Tavily Search Agent
 """
+import asyncio
+import functools
 import os
-from uuid import uuid4
-from langgraph.graph.state import Runnable
-from pydantic.v1.networks import MultiHostDsn
-from src.agents.base.base_agent import BaseLangGraphAgent
+from types import MappingProxyType
+from uuid import UUID, uuid4
+from src.agents.base.base_agent import (
+    BaseLangGraphAgent,
+    SHARED_HTTP_CLIENT,
+    agent_node,
+    create_shared_http_client,
+)
+from src.utils.env_validator import get_env_variable
 
 from typing import TypedDict, ClassVar, Any
+
+import httpx
 from typing_extensions import Annotated
 
 from langchain_openai import ChatOpenAI
 from langchain_core.messages import (
     HumanMessage,
-    AIMessage,
     BaseMessage,
 )
 from langchain_core.runnables import RunnableConfig
@@ -22,6 +30,55 @@ from langgraph.graph import StateGraph, START, END, add_messages
 from langgraph.prebuilt import create_react_agent
 from langchain_mcp_adapters.client import MultiServerMCPClient
 
+# -----------------------------------------------------------
+# Chat Model Pool
+# -----------------------------------------------------------
+_LLM_POOL: dict[tuple, ChatOpenAI] = {}
+
+def get_pooled_llm(
+    model_name: str = "gpt-4o-mini",
+    temperature: float = 0,
+    base_url: str | None = None,
+) -> ChatOpenAI:
+    """
+    Get ChatOpenAI instance shared by every agent with the same settings
+
+    Args:
+        model_name: str = "gpt-4o-mini"
+        temperature: float = 0
+        base_url: str | None = None
+    """
+
+    key = (model_name, temperature, base_url)
+    if key not in _LLM_POOL:
+        _LLM_POOL[key] = ChatOpenAI(
+            model=model_name,
+            temperature=temperature,
+            base_url=base_url,
+            http_async_client=SHARED_HTTP_CLIENT,
+        )
+    return _LLM_POOL[key]
+
+# -----------------------------------------------------------
+# Prompt
+# -----------------------------------------------------------
+_REACT_AGENT_PROMPT = """
+당신은 웹 도구를 가진 검색 전문가입니다.
+
+임무 : 사용자의 질문에 실시간 정보를 반영한 답변을 제공하기 위해 검색 도구로 검색을 수행하고, 이를 기반으로 답변하는 것.
+
+도구:
+    - search_web : 기본 웹 검색 도구
+    - search_news : 뉴스 검색 도구
+    - search_finance : 금융 도메인 검색 도구
+
+지시사항:
+    - 사용자의 질문에 답변하기 위해 적절한 검색어를 만들어 검색을 수행하세요.
+    - 수집된 결과가 부족하다면 "모른다"고 답하세요.
+    - 수집된 결과에만 기반하여 답변을 제공하세요.
+    - 답변에 반드시 출처를 포함하세요.
+"""
+
 # -----------------------------------------------------------
 # Schema
 # -----------------------------------------------------------
@@ -80,10 +137,10 @@ class TavilySearchAgent(BaseLangGraphAgent):
             auto_build=auto_build,
         )
 
-        self.model = model
         self.mcp_server_url = "http://localhost:3000/mcp/"
         self.mcp_server_config = {
-            "transport" : "streamable_http"
+            "transport" : "streamable_http",
+            "httpx_client_factory" : create_shared_http_client,
         }
         self.mcp_client = MultiServerMCPClient(
             {
@@ -94,6 +151,7 @@ class TavilySearchAgent(BaseLangGraphAgent):
             }
         )
         self.tools = []
+        self.response_cache = None
     
     # -----------------------------------------------------------
     # Implement Graph Nodes and Edges
@@ -103,11 +161,11 @@ class TavilySearchAgent(BaseLangGraphAgent):
         Initialize Nodes for Tavily Search Agent
         """
 
-        graph.add_node(self.get_node_name("SEARCH_AGENT"), self.get_react_agent())
+        graph.add_node(self.NODE_NAMES["SEARCH_AGENT"], agent_node("_search_agent_node"))
     
     def _init_edges(self, graph: StateGraph) -> None:
-        graph.add_edge(START, self.get_node_name("SEARCH_AGENT"))
-        graph.add_edge(self.get_node_name("SEARCH_AGENT"), END)
+        graph.add_edge(START, self.NODE_NAMES["SEARCH_AGENT"])
+        graph.add_edge(self.NODE_NAMES["SEARCH_AGENT"], END)
     
     # -----------------------------------------------------------
     # create agent application
@@ -121,79 +179,208 @@ class TavilySearchAgent(BaseLangGraphAgent):
         output_schema: OutputSchema | None = None,
         agent_name: str | None = None,
         enable_langsmith_tracing: bool = False,
+        enable_response_cache: bool = False,
+        response_cache_path: str | None = None,
+        response_cache_options: dict[str, Any] | None = None,
     ) -> "TavilySearchAgent":
         """
         Async Initialize Tavily Search Agent
 
         Graph will be build after load mcp tools.
+        Semantic response cache is created when `enable_response_cache` is True,
+        persisted to `response_cache_path` (SQLite) when given.
+        `response_cache_options` are passed to SemanticResponseCache (e.g. maxsize, quantize).
         """
 
         self = cls(
-            model=model or ChatOpenAI(model="gpt-4o-mini", temperature=0),
+            model=model or get_pooled_llm(),
             state_schema=state_schema or StateSchema,
             input_schema=input_schema or InputSchema,
             output_schema=output_schema or OutputSchema,
             agent_name=agent_name or cls.__name__,
         )
         
-        self.tools = await self.mcp_client.get_tools()
+        self.tools = await self.get_cached_tools(
+            mcp_client=self.mcp_client,
+            cache_key=(self.mcp_server_url, frozenset(self.mcp_server_config.items())),
+        )
         self.build_graph() # build sub graph
 
+        if enable_response_cache:
+            from src.agents.cache.semantic_cache import SemanticResponseCache
+            # loading the sentence transformer is blocking disk / cpu work
+            self.response_cache = await asyncio.to_thread(
+                SemanticResponseCache,
+                ltm_path=response_cache_path,
+                **(response_cache_options or {}),
+            )
+
         return self
 
+    async def aclose(self) -> None:
+        """
+        Stop embedding worker and persist semantic response cache
+        """
+
+        if self.response_cache is None:
+            return
+
+        response_cache, self.response_cache = self.response_cache, None
+        await response_cache.batcher.aclose()
+        await asyncio.to_thread(response_cache.close)
+
+    # -----------------------------------------------------------
+    # Connection Warm-up
+    # -----------------------------------------------------------
+    async def warmup(self) -> None:
+        """
+        Pre-open pooled connection to MCP Server so the first request skips the handshake
+        """
+
+        health_url = httpx.URL(self.mcp_server_url).join("/health")
+        try:
+            await SHARED_HTTP_CLIENT.get(health_url)
+        except httpx.HTTPError:
+            pass
+
+    # -----------------------------------------------------------
+    # Cached Invocation
+    # -----------------------------------------------------------
+    async def cached_ainvoke(
+        self,
+        state: dict,
+        config: RunnableConfig | None = None,
+    ) -> dict:
+        """
+        Invoke graph, returning cached response for exact or semantically similar queries
+
+        Caching is only used for deterministic models (temperature == 0).
+
+        Args:
+            state: Input State (last message is used as cache query)
+            config: RunnableConfig | None = None
+        """
+
+        if self.response_cache is None or getattr(self.model, "temperature", None) != 0:
+            return await self.graph.ainvoke(state, config)
+
+        from src.agents.cache.semantic_cache import make_exact_key
+
+        query = state["messages"][-1].content
+        exact_key = make_exact_key(
+            model_name=getattr(self.model, "model_name", None),
+            messages=state["messages"],
+            tool_names=(tool.name for tool in self.tools),
+        )
+        cached_response = await self.response_cache.lookup(query, exact_key=exact_key)
+        if cached_response is not None:
+            return cached_response
+
+        response = await self.graph.ainvoke(state, config)
+        await self.response_cache.insert(query, response, exact_key=exact_key)
+
+        return response
+
+    # -----------------------------------------------------------
+    # Batch Invocation
+    # -----------------------------------------------------------
+    async def abatch(
+        self,
+        queries: list[str],
+        max_concurrency: int | None = None,
+        config: RunnableConfig | None = None,
+    ) -> list[str]:
+        """
+        Run multiple queries concurrently, capped by a semaphore, returning responses in query order
+
+        Args:
+            queries: list[str]
+            max_concurrency: int | None = None (AGENT_MAX_PARALLEL env, default 16)
+            config: RunnableConfig | None = None
+        """
+
+        semaphore = asyncio.Semaphore(
+            max_concurrency or int(get_env_variable("AGENT_MAX_PARALLEL", "16"))
+        )
+
+        async def _run_one(query: str) -> str:
+            async with semaphore:
+                result = await self.cached_ainvoke(
+                    {"messages": [HumanMessage(content=query)]},
+                    config,
+                )
+            return result["response"]
+
+        return await asyncio.gather(*(_run_one(query) for query in queries))
+
     # -----------------------------------------------------------
     # Node Methods
     # -----------------------------------------------------------
-    def get_react_agent(self):
-        prompt = """
-        당신은 웹 도구를 가진 검색 전문가입니다.
-        
-        임무 : 사용자의 질문에 실시간 정보를 반영한 답변을 제공하기 위해 검색 도구로 검색을 수행하고, 이를 기반으로 답변하는 것.
-        
-        도구: 
-            - search_web : 기본 웹 검색 도구
-            - search_news : 뉴스 검색 도구
-            - search_finance : 금융 도메인 검색 도구
-        
-        지시사항:
-            - 사용자의 질문에 답변하기 위해 적절한 검색어를 만들어 검색을 수행하세요.
-            - 수집된 결과가 부족하다면 "모른다"고 답하세요.
-            - 수집된 결과에만 기반하여 답변을 제공하세요.
-            - 답변에 반드시 출처를 포함하세요.
+    async def _search_agent_node(self, state: dict) -> dict:
+        """
+        Search Agent Node for Tavily Search Agent
+
+        `response` is filled from the final AI message so graph output is not empty.
+        """
+
+        result = await self.react_agent.ainvoke(state)
+        return {
+            "messages": result["messages"],
+            "response": result["messages"][-1].content,
+        }
+
+    @functools.cached_property
+    def react_agent(self):
+        """
+        ReAct Agent over loaded MCP tools (built once per instance)
         """
+
         return create_react_agent(
             self.model,
             tools=self.tools,
-            prompt=prompt
+            prompt=_REACT_AGENT_PROMPT,
         )
-    
+
 # -----------------------------------------------------------
 # run config utility (include langsmith tracing)
 # -----------------------------------------------------------
+_DEFAULT_TAGS = ("tavily-search",)
+
+@functools.cache
+def _default_metadata() -> MappingProxyType:
+    # built on first use, not at import : scripts call load_dotenv() after importing this module
+    return MappingProxyType({
+        "agent_type" : "tavily-search",
+        "version" : "0.0.1",
+        "environment" : os.getenv("ENV", "development"),
+    })
+
 def create_run_config(
         run_name: str | None = None,
         tags: list[str] | None = None,
         metadata: dict[str, Any] | None = None,
-        enable_langsmith_tracing: bool = False
+        enable_langsmith_tracing: bool = False,
+        run_id_bytes: bytes | None = None,
     ) -> RunnableConfig:
     """
     Create RunnableConfig for LangSmith Tracing
+
+    Args:
+        run_id_bytes: 16 random bytes for run id (e.g. os.urandom(16)) to skip uuid4 in bulk calls
     """
+    run_id = UUID(bytes=run_id_bytes, version=4) if run_id_bytes else uuid4()
+
     if enable_langsmith_tracing:
         config = RunnableConfig(
-            configurable={"run_id": uuid4()},
-            run_name=run_name or f"DefaultRunName",
-            run_id=uuid4(),
-            tags=tags or ["tavily-search"],
-            metadata=metadata or {
-                "agent_type" : "tavily-search",
-                "version" : "0.0.1",
-                "environment" : os.getenv("ENV", "development")
-            }
+            configurable={"run_id": run_id},
+            run_name=run_name or "DefaultRunName",
+            run_id=run_id,
+            tags=list(tags or _DEFAULT_TAGS),
+            metadata=metadata or dict(_default_metadata()),
         )
     else:
         config = RunnableConfig(
-            configurable={"run_id": uuid4()}
+            configurable={"run_id": run_id}
         )
 
     return config
\ No newline at end of file
@@ -4,24 +4,96 @@ Base MCP Server Class.
 
 import time
 from abc import ABC, abstractmethod
+import asyncio
+import atexit
+import cProfile
+import copy
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from hashlib import blake2b
 import logging
-from typing import Any, Literal
+import os
+import queue
+import tempfile
+import threading
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Callable, Literal
+import orjson
 from pydantic import BaseModel, ConfigDict, Field
 
+from fastmcp import FastMCP
 from fastmcp.server.middleware import Middleware, MiddlewareContext
 from fastmcp.server.http import StarletteWithLifespan
-from starlette.requests import Request
-from starlette.responses import JSONResponse
+
+from src.utils.env_validator import get_env_variable
+
+ORJSON_OPTS = orjson.OPT_NON_STR_KEYS
+
+def _orjson_default(obj: Any) -> Any:
+    """
+    Fallback serializer for objects orjson does not support natively.
+    """
+    if isinstance(obj, BaseModel):
+        # call the class's compiled serializer directly (skips model_dump argument handling)
+        return obj.__pydantic_serializer__.to_python(obj, mode="json")
+    return str(obj)
+
+# -----------------------------------------------------------
+# Non-blocking Logging Pipeline
+# -----------------------------------------------------------
+LOG_FORMAT = '%(asctime)s %(levelname)s > %(message)s'
+
+# shared Formatter : ISO-8601 timestamps without the per-record millisecond suffix
+_DEFAULT_FORMATTER = logging.Formatter(LOG_FORMAT, datefmt="%Y-%m-%dT%H:%M:%S")
+_DEFAULT_FORMATTER.default_msec_format = None
+
+_LOG_QUEUE: queue.Queue | None = None
+_LOG_LISTENER: QueueListener | None = None
+
+class _RawQueueHandler(QueueHandler):
+    """
+    QueueHandler that leaves formatting to the listener's handlers.
+
+    The stock `prepare` formats the record (timestamp, traceback) on the emitting thread.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # only interpolate args now (they may be mutated after the call); exc_info is formatted by the listener
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+def _get_log_queue() -> queue.Queue:
+    """
+    Return the process-wide log queue, starting its QueueListener on first use.
+
+    Loggers only enqueue records (no lock, no I/O on the event loop);
+    the listener thread formats them and writes to stderr.
+    """
+    global _LOG_QUEUE, _LOG_LISTENER
+
+    if _LOG_QUEUE is None:
+        stream_handler = logging.StreamHandler()
+        stream_handler.setFormatter(_DEFAULT_FORMATTER)
+
+        _LOG_QUEUE = queue.Queue(-1)
+        _LOG_LISTENER = QueueListener(_LOG_QUEUE, stream_handler, respect_handler_level=True)
+        _LOG_LISTENER.start()
+        atexit.register(_LOG_LISTENER.stop) # flush pending records on shutdown
+
+    return _LOG_QUEUE
 
 # -----------------------------------------------------------
 # Standard Response Model
+# (schema documentation only; responses are built as plain dicts)
 # -----------------------------------------------------------
 class StandardResponse(BaseModel):
     """
     Standard MCP Server Response Model.
     """
 
-    model_config = ConfigDict(extra='allow')
+    model_config = ConfigDict(extra='ignore')
 
     success: bool = Field(..., description="Boolean Value of Success or Failure")
     query: str = Field(..., description="User's Initial Query")
@@ -33,13 +105,68 @@ class StandardErrorResponse(BaseModel):
     Standard MCP Server Error Response Model.
     """
 
-    model_config = ConfigDict(extra='allow')
+    model_config = ConfigDict(extra='ignore')
 
     success: bool = Field(False, description="Boolean Value of Success or Failure (Always False)")
     query: str = Field(..., description="User's Initial Query")
     error: str = Field(..., description="Error Message")
     func_name: str | None = Field(None, description="Function Name that Caused Error")
 
+# -----------------------------------------------------------
+# Pure ASGI Middleware
+# -----------------------------------------------------------
+class TimingASGIMiddleware:
+    """
+    Request-level Timing Middleware on raw ASGI messages.
+
+    Appends `x-response-time` (ms) header without building Request/Response objects.
+    """
+
+    def __init__(self, app: StarletteWithLifespan) -> None:
+        self.app = app
+
+    def __getattr__(self, name: str) -> Any:
+        # expose wrapped app attributes (state, lifespan, routes, ...)
+        return getattr(self.app, name)
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_ns = time.monotonic_ns()
+
+        async def send_wrapper(message) -> None:
+            if message["type"] == "http.response.start":
+                duration_us = (time.monotonic_ns() - start_ns) // 1000
+                message["headers"] = [
+                    *message.get("headers", []),
+                    (b"x-response-time", f"{duration_us / 1000:.2f}".encode()),
+                ]
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+class StaticJSONEndpoint:
+    """
+    Pure ASGI endpoint that always replies 200 with a constant JSON body.
+
+    Header tuples are encoded once; no Request/Response objects per call.
+    (an instance is not a function, so Starlette's Route mounts it as a raw ASGI app)
+    """
+
+    def __init__(self, body: bytes) -> None:
+        self.body = body
+        self.headers = [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+        ]
+
+    async def __call__(self, scope, receive, send) -> None:
+        # fresh start message and header list per call : outer middlewares may edit headers in place
+        await send({"type": "http.response.start", "status": 200, "headers": list(self.headers)})
+        await send({"type": "http.response.body", "body": self.body})
+
 # -----------------------------------------------------------
 # Base MCP Server Class
 # -----------------------------------------------------------
@@ -65,8 +192,6 @@ class BaseMCPServer(ABC):
             server_instructions: Instructions of MCP Server
         """
 
-        from fastmcp import FastMCP
-
         self.server_name = server_name
         self.server_instructions = server_instructions
         self.server_version = server_version
@@ -74,6 +199,13 @@ class BaseMCPServer(ABC):
         self.json_response = json_response
         self.enable_swagger = enable_swagger
 
+        # ASGI app is built once by create_app and memoized
+        self._app: TimingASGIMiddleware | None = None
+        self._app_lock = threading.Lock()
+
+        # tool name -> cache ttl of tools opted in with `cache_ttl`
+        self._tool_cache_ttls: dict[str, float] = {}
+
         # Create FastMCP Instance
         self.mcp = FastMCP(
             name = self.server_name or self.__class__.__name__,
@@ -83,9 +215,10 @@ class BaseMCPServer(ABC):
         # Create Logger
         self.logger = logging.getLogger(self.__class__.__name__)
         self.logger.setLevel(logging.INFO)
-        stream_handler = logging.StreamHandler()
-        stream_handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)s > %(message)s'))
-        self.logger.addHandler(stream_handler)
+        if not self.logger.handlers:
+            # records are only enqueued here; formatting and stream I/O run on the listener thread
+            self.logger.addHandler(_RawQueueHandler(_get_log_queue()))
+            self.logger.propagate = False # emitted once by our listener, not again by root handlers
         self.mcp.logger = self.logger
 
         # Initialize Clients
@@ -96,6 +229,16 @@ class BaseMCPServer(ABC):
 
         # Install Core Middlewares
         self._install_core_middlewares()
+
+        # Register Health Route (payload is constant : serialized once)
+        self._health_payload = self.create_standard_response_bytes(
+            success=True,
+            query="MCP Server Health Check",
+            data="OK",
+        )
+        self.mcp.custom_route(path='/health', methods=['GET'], include_in_schema=True)(
+            StaticJSONEndpoint(self._health_payload)
+        )
     
     # -----------------------------------------------------------
     # Should Implement in each MCP Server
@@ -110,6 +253,10 @@ class BaseMCPServer(ABC):
         """Register MCP Tools."""
         pass
 
+    async def _close_clients(self) -> None:
+        """Close Client Instances on app shutdown (override if clients hold connections)."""
+        pass
+
     # -----------------------------------------------------------
     # Create Standard / Error Response
     # -----------------------------------------------------------
@@ -130,17 +277,40 @@ class BaseMCPServer(ABC):
             error: Error Message (Failure)
         """
 
-        # create response model instance
-        _response = StandardResponse(
-            success = success,
-            query = query,
-            data = data,
-            error = error,
-        )
-        # serialize response model instance
-        response = _response.model_dump(exclude_none=True)
+        # build response dict directly (no model validation / dump, no None filtering pass)
+        response = {
+            "success" : success,
+            "query" : query,
+        }
+        if data is not None:
+            response["data"] = data
+        if error is not None:
+            response["error"] = error
 
         return response
+
+    def create_standard_response_bytes(
+        self,
+        success: bool,
+        query: str,
+        data: Any | None = None,
+        error: str | None = None,
+    ) -> bytes:
+        """
+        Create Standard Response serialized to JSON bytes.
+
+        Args:
+            success: Boolean Value of Success or Failure
+            query: User's Initial Query
+            data: Response Data (Success)
+            error: Error Message (Failure)
+        """
+
+        return orjson.dumps(
+            self.create_standard_response(success=success, query=query, data=data, error=error),
+            default=_orjson_default,
+            option=ORJSON_OPTS,
+        )
     
     def create_error_response(
         self,
@@ -157,44 +327,81 @@ class BaseMCPServer(ABC):
             func_name: Function Name that Caused Error
         """
 
-        # create error response model instance
-        _error_response = StandardErrorResponse(
-            error = str(error),
-            query = query,
-            func_name = func_name,
-            success = False,
-        )
-        # serialize error response model instance
-        error_response = _error_response.model_dump(exclude_none=True)
+        # build error response dict directly (no model validation / dump)
+        error_response = {
+            "success" : False,
+            "query" : query,
+            "error" : str(error),
+        }
+        if func_name is not None:
+            error_response["func_name"] = func_name
 
         return error_response
 
+    # -----------------------------------------------------------
+    # Tool Response Cache Opt-in
+    # -----------------------------------------------------------
+    def cache_ttl(self, seconds: float) -> Callable[[Callable], Callable]:
+        """
+        Mark an idempotent tool function as cacheable by CachingMiddleware.
+
+        Use in `_register_tools` below `@self.mcp.tool()` (tool name must be the function name).
+        CachingMiddleware is installed only when at least one tool opts in.
+
+        Args:
+            seconds: Time-to-live of a cached tool response
+        """
+
+        def decorator(fn: Callable) -> Callable:
+            self._tool_cache_ttls[fn.__name__] = seconds
+            return fn
+
+        return decorator
+
     # -----------------------------------------------------------
     # Create Server Instance
     # -----------------------------------------------------------
-    def create_app(self) -> StarletteWithLifespan:
+    def create_app(self) -> TimingASGIMiddleware:
         """
         Create ASGI(Starlette) Application with Lifespan.
 
-        - register /health route only once.
-        - return http_app of FastMCP
+        - return http_app of FastMCP wrapped with pure ASGI timing middleware
+        - app is built once; later calls return the same instance
         """
 
-        if not getattr(self, "_health_route_registered", False):
-            @self.mcp.custom_route(path='/health', methods=['GET'], include_in_schema=True)
-            async def health_check(request: Request) -> JSONResponse:
-                _response = self.create_standard_response(
-                    success=True,
-                    query="MCP Server Health Check",
-                    data="OK",
-                )
-                return JSONResponse(content=_response)
-            setattr(self, "_health_route_registered", True)
-        
-        return self.mcp.http_app(
+        if self._app is not None:
+            return self._app
+
+        with self._app_lock:
+            if self._app is None:
+                self._app = self._build_app()
+
+        return self._app
+
+    def _build_app(self) -> TimingASGIMiddleware:
+        """
+        Build the wrapped FastMCP http_app.
+        """
+
+        app = self.mcp.http_app(
             path=self.MCP_PATH,
             json_response=self.json_response
         )
+
+        # close clients once, when the app (not each MCP session) shuts down
+        app_lifespan = app.router.lifespan_context
+
+        @asynccontextmanager
+        async def lifespan(app: StarletteWithLifespan):
+            async with app_lifespan(app) as state:
+                try:
+                    yield state
+                finally:
+                    await self._close_clients()
+
+        app.router.lifespan_context = lifespan
+
+        return TimingASGIMiddleware(app)
     
     # -----------------------------------------------------------
     # Install Core Middlewares
@@ -203,107 +410,157 @@ class BaseMCPServer(ABC):
         """
         Install Core Middleware Classes in Server.
         """
-        # Install error handling middleware with server reference
-        self.mcp.add_middleware(self.ErrorHandlingMiddleware())
-        self.mcp.add_middleware(self.TimingMiddleware())
-        self.mcp.add_middleware(self.LoggingMiddleware())
+        # Install middlewares with server reference (bound once, not probed per call)
+        self.mcp.add_middleware(self.ObservabilityMiddleware(self))
+
+        # inner : hits are still timed and logged (only when a tool opted in with `cache_ttl`)
+        if self._tool_cache_ttls:
+            self.mcp.add_middleware(self.CachingMiddleware(self))
+
+        # opt-in profiling of tool code (zero cost unless MCP_PROFILE=1)
+        if get_env_variable("MCP_PROFILE") == "1":
+            self.mcp.add_middleware(self.ProfilerMiddleware(self))
     
     # -----------------------------------------------------------
     # Core Middleware Classes
     # -----------------------------------------------------------
-    class ErrorHandlingMiddleware(Middleware):
+    class ObservabilityMiddleware(Middleware):
         """
-        Error Handling Middleware Class.
+        Error Handling + Logging + Timing of Tool Calls in a single middleware frame.
         """
 
+        def __init__(self, server: "BaseMCPServer") -> None:
+            self.logger = server.logger
+
         async def on_call_tool(
             self,
             context: MiddlewareContext,
             call_next
         ) -> dict[str, Any]:
             """
-            Handle Error in Tool Call.
+            Log, time and error-log a Tool Call.
 
             Args:
                 context: Middleware Context
                 call_next (Callable): Next Middleware or Tool Call
             """
 
-            try:
-                return await call_next(context=context)
+            logger = self.logger
 
-            except Exception as error:
-                # Try convert Exception into standard error response model
-                try:
-                    # Logging Error Message
-                    server = context.fastmcp_context.fastmcp
-                    logger = getattr(server, "logger", None)
-                    if logger:
-                        logger.error(f"ToolError : {error}", exec_info=True)
-                    else:
-                        logger.warning("Logger Not Found in Server")
-                except Exception:
-                    pass
+            # skip meta collection and formatting when INFO is disabled
+            log_enabled = logger.isEnabledFor(logging.INFO)
+
+            # Logging Start Processing Tool Request
+            if log_enabled:
+                meta = {
+                    "request_id" : getattr(context.fastmcp_context, "request_id", None),
+                    "client_id" : getattr(context.fastmcp_context, "client_id", None),
+                    "session_id" : getattr(context.fastmcp_context, "session_id", None),
+                }
+                logger.info("Start Processing Tool Request : %s", meta)
 
+            start_ns = time.monotonic_ns()
+
+            try:
+                response = await call_next(context=context)
+            except Exception as error:
+                # Logging Error Message
+                logger.error("ToolError : %s", error, exc_info=True)
                 raise # FastMCP will handle the error and return the error response
 
-    class LoggingMiddleware(Middleware):
+            # Logging Success Response (integer us, converted to ms only when logged)
+            if log_enabled:
+                duration_us = (time.monotonic_ns() - start_ns) // 1000
+                logger.info("Successfully Processed Tool Request : duration_ms=%s", duration_us / 1000)
+
+            return response
+
+    class CachingMiddleware(Middleware):
         """
-        Logging Middleware Class.
+        Response Cache for idempotent Tools (opt-in with `@self.cache_ttl(seconds)`).
+
+        Key is blake2b(tool name + sorted-key JSON arguments); entries live in a
+        bounded LRU OrderedDict guarded by an asyncio.Lock.
         """
 
+        MAXSIZE = 1024
+
+        def __init__(self, server: "BaseMCPServer") -> None:
+            self._ttls = server._tool_cache_ttls
+            self._cache: OrderedDict[bytes, tuple[float, Any]] = OrderedDict()
+            self._lock = asyncio.Lock()
+
         async def on_call_tool(
             self,
             context: MiddlewareContext,
             call_next
-        ) -> dict[str, Any]:
-            try:
-                # Get logger
-                server = context.fastmcp_context.fastmcp
-                logger = getattr(server, "logger", None)
-
-                # Logging Start Processing Tool Request
-                if logger:
-                    meta = {
-                        "request_id" : getattr(context.fastmcp_context, "request_id", None),
-                        "client_id" : getattr(context.fastmcp_context, "client_id", None),
-                        "session_id" : getattr(context.fastmcp_context, "session_id", None),
-                    }
-                    logger.info(f"Start Processing Tool Request : {meta}")
-                else:
-                    logger.warning("Logger Not Found in Server")
-
-                response = await call_next(context=context)
+        ):
+            tool_name = context.message.name
+            ttl = self._ttls.get(tool_name)
+            if not ttl:
+                return await call_next(context=context)
 
-                # Logging Success Response
-                if logger:
-                    try:
-                        duration_ms = context.fastmcp_context.get_state("duration_ms")
-                        logger.info(f"Successfully Processed Tool Request : duration_ms={duration_ms}")
-                    except Exception:
-                        pass
-                
+            key = blake2b(
+                tool_name.encode() + orjson.dumps(
+                    context.message.arguments or {},
+                    default=str,
+                    option=orjson.OPT_SORT_KEYS | ORJSON_OPTS,
+                ),
+                digest_size=16,
+            ).digest()
+
+            now = time.monotonic()
+            async with self._lock:
+                entry = self._cache.get(key)
+                if entry is not None:
+                    if entry[0] > now:
+                        self._cache.move_to_end(key)
+                        return entry[1]
+                    del self._cache[key]
+
+            response = await call_next(context=context)
+
+            # do not cache error responses returned by the tool
+            structured = getattr(response, "structured_content", None)
+            if isinstance(structured, dict) and structured.get("success") is False:
                 return response
-            except Exception:
-                raise
-        
-    class TimingMiddleware(Middleware):
+
+            async with self._lock:
+                self._cache[key] = (time.monotonic() + ttl, response)
+                self._cache.move_to_end(key)
+                if len(self._cache) > self.MAXSIZE:
+                    self._cache.popitem(last=False)
+
+            return response
+
+    class ProfilerMiddleware(Middleware):
         """
-        Calculate Processing Time of Tool Call.
+        Profile Tool Calls with cProfile (installed only when MCP_PROFILE=1).
+
+        Stats are dumped to `{profile_dir}/mcp-{tool}-{ns}.prof` (load with pstats / snakeviz).
+        Calls are serialized while profiling : only one profiler can be active at a time.
         """
 
+        def __init__(self, server: "BaseMCPServer", profile_dir: str | None = None) -> None:
+            self.logger = server.logger
+            self.profile_dir = profile_dir or get_env_variable("MCP_PROFILE_DIR", tempfile.gettempdir())
+            self._lock = asyncio.Lock()
+
         async def on_call_tool(
             self,
             context: MiddlewareContext,
             call_next
         ):
-            start = time.perf_counter()
-
-            try:
-                return await call_next(context=context)
-            finally:
-                duration_ms = (time.perf_counter() - start) * 1000.0
+            async with self._lock:
+                profiler = cProfile.Profile()
+                profiler.enable()
                 try:
-                    context.fastmcp_context.set_state("duration_ms", duration_ms)
-                except Exception:
-                    pass
\ No newline at end of file
+                    return await call_next(context=context)
+                finally:
+                    profiler.disable()
+                    path = os.path.join(
+                        self.profile_dir,
+                        f"mcp-{context.message.name}-{time.time_ns()}.prof",
+                    )
+                    profiler.dump_stats(path)
+                    self.logger.info("Tool Profile Saved : %s", path)
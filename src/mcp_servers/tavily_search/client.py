@@ -4,14 +4,134 @@ Tavily Search Client.
 
 from src.utils.env_validator import get_env_variable
 
+import asyncio
 import logging
-from typing import Any, Literal, Sequence, Union, cast
+import time
+from collections import OrderedDict
+from hashlib import blake2b
+from typing import Any, Literal, Sequence, Union
+
+import httpx
+import orjson
+from aiolimiter import AsyncLimiter
+
+_FMT = logging.Formatter('[%(levelname)s] %(asctime)s > %(message)s')
 
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.INFO)
-stream_handler = logging.StreamHandler()
-stream_handler.setFormatter(logging.Formatter('[%(levelname)s] %(asctime)s > %(message)s'))
-logger.addHandler(stream_handler)
+if not logger.handlers:
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(_FMT)
+    logger.addHandler(stream_handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+# -----------------------------------------------------------
+# Tavily REST Endpoint / Connection Pool
+# -----------------------------------------------------------
+TAVILY_BASE_URL = "https://api.tavily.com"
+
+# single upstream host : total limit == per-host limit
+HTTP_LIMITS = httpx.Limits(
+    max_keepalive_connections=50,
+    max_connections=50,
+    keepalive_expiry=60.0,
+)
+# HTTP/2 multiplexes concurrent searches on one connection (requires httpx[http2])
+try:
+    import h2  # noqa: F401
+    HTTP2_ENABLED = True
+except ImportError:
+    HTTP2_ENABLED = False
+
+# one keep-alive pool per process, shared by every TavilySearchClient
+TAVILY_HTTP_CLIENT = httpx.AsyncClient(
+    base_url=TAVILY_BASE_URL,
+    headers={"Content-Type": "application/json"},
+    timeout=60,
+    limits=HTTP_LIMITS,
+    http2=HTTP2_ENABLED,
+)
+
+async def aclose_tavily_http_client() -> None:
+    """
+    Close the shared Tavily connection pool (owned by the application lifespan).
+    """
+
+    await TAVILY_HTTP_CLIENT.aclose()
+
+# body fields of POST /search (`timeout` is applied as the HTTP timeout, not sent)
+_SEARCH_FIELDS = (
+    "query",
+    "search_depth",
+    "topic",
+    "time_range",
+    "start_date",
+    "end_date",
+    "days",
+    "max_results",
+    "include_domains",
+    "exclude_domains",
+    "include_answer",
+    "include_raw_content",
+    "include_images",
+    "country",
+)
+_DOMAIN_FIELDS = ("include_domains", "exclude_domains")
+
+# -----------------------------------------------------------
+# Result Trimming (fewer bytes in the tool output -> fewer LLM input tokens)
+# -----------------------------------------------------------
+# raw_content / answer / images only appear when requested (include_* parameters)
+_RESULT_FIELDS = ("title", "url", "content", "score", "published_date", "raw_content")
+_RESPONSE_FIELDS = ("answer", "images")
+
+def _trim_results(search_result: dict[str, Any]) -> dict[str, Any]:
+    """
+    Keep only the fields the agent uses from a Tavily search response.
+
+    Args:
+        search_result : Decoded Tavily response
+    """
+
+    trimmed = {
+        "query" : search_result.get("query"),
+        "results" : [
+            {key: result[key] for key in _RESULT_FIELDS if result.get(key) is not None}
+            for result in search_result.get("results", ())
+        ],
+    }
+    for key in _RESPONSE_FIELDS:
+        if search_result.get(key):
+            trimmed[key] = search_result[key]
+    return trimmed
+
+# -----------------------------------------------------------
+# Search Result Cache
+# -----------------------------------------------------------
+# TTL tiers by content change rate : news / finance go stale in minutes, general results last longer
+CACHE_TTL_SECONDS = {
+    "news" : 300,
+    "finance" : 300,
+    "general_short" : 600, # time_range day / week
+    "general_long" : 3600,
+}
+_SHORT_TIME_RANGES = frozenset({"day", "week"})
+CACHE_MAXSIZE = 512
+
+def _cache_ttl(payload: dict[str, Any]) -> int:
+    """
+    Pick the cache TTL tier of a search from its topic and time range.
+
+    Args:
+        payload : Tavily request body
+    """
+
+    topic = payload["topic"]
+    if topic != "general":
+        return CACHE_TTL_SECONDS.get(topic, CACHE_TTL_SECONDS["news"])
+    if payload.get("time_range") in _SHORT_TIME_RANGES:
+        return CACHE_TTL_SECONDS["general_short"]
+    return CACHE_TTL_SECONDS["general_long"]
 
 class TavilySearchClient:
     """
@@ -32,6 +152,21 @@ class TavilySearchClient:
 
         if self.api_key == "INPUT_YOUR_API_KEY":
             logger.warning("Tavily API Key is not set. Please set TAVILY_API_KEY in env.")
+
+        # module-level async HTTP client : searches share its keep-alive pool without blocking the event loop
+        self._http = TAVILY_HTTP_CLIENT
+        self._headers = {"Authorization": f"Bearer {self.api_key}"}
+
+        # cap concurrent upstream calls (tune against Tavily's rate limit)
+        self._semaphore = asyncio.Semaphore(int(get_env_variable("TAVILY_MAX_CONCURRENCY", "10")))
+        # pace requests at Tavily's per-second quota (avoids 429 + retry backoff under bursts)
+        self._limiter = AsyncLimiter(max_rate=int(get_env_variable("TAVILY_RPS", "5")), time_period=1)
+
+        # LRU of blake2b(request body) -> (expiry, results)
+        # (no await between lookup and update, so no lock is needed on one event loop)
+        self._cache: OrderedDict[bytes, tuple[float, dict[str, Any]]] = OrderedDict()
+        # in-flight upstream searches by cache key
+        self._inflight: dict[bytes, asyncio.Future] = {}
     
     async def search(
         self,
@@ -75,33 +210,59 @@ class TavilySearchClient:
         Returns:
             dictionary of Search Results
         """
-        from tavily import TavilyClient
-
-        # initialize tavily client
-        client = TavilyClient(api_key=self.api_key)
-
-        # set search parameters
-        search_params = {
-            'query' : query,
-            'max_results' : max_results,
-            'search_depth' : search_depth,
-            'topic' : topic or "general",
-            'time_range' : time_range,
-            'start_date' : start_date,
-            'end_date' : end_date,
-            'days' : days,
-            'include_domains' : include_domains,
-            'exclude_domains' : exclude_domains,
-            'include_answer' : include_answer,
-            'include_raw_content' : include_raw_content,
-            'include_images' : include_images,
-            'timeout' : timeout,
-            'country' : country,
-        }
-        
-        # Execute Search
-        results = client.search(**search_params)
-
-        logger.info(f"Search Results: {len(results)}")
-
-        return cast(dict[str, Any], results)
+        # build request body from arguments (None values are not sent)
+        params = locals()
+        payload = {key: params[key] for key in _SEARCH_FIELDS if params[key] is not None}
+        payload.setdefault("topic", "general")
+
+        # domain filters are sets : normalize order so equivalent searches share a cache entry
+        for field in _DOMAIN_FIELDS:
+            if field in payload:
+                payload[field] = sorted(payload[field])
+
+        # sorted keys : same parameters give the same body bytes / cache key
+        body = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+        key = blake2b(body, digest_size=16).digest()
+
+        entry = self._cache.get(key)
+        if entry is not None:
+            if entry[0] > time.monotonic():
+                self._cache.move_to_end(key)
+                return entry[1]
+            del self._cache[key]
+
+        # single-flight : concurrent identical searches await one upstream call
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch(key, body, _cache_ttl(payload), timeout))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+
+        # shield : a cancelled caller does not cancel the search other callers wait on
+        return await asyncio.shield(task)
+
+    async def _fetch(self, key: bytes, body: bytes, ttl: int, timeout: int) -> dict[str, Any]:
+        """
+        Execute Search upstream and store the results in the cache.
+
+        Args:
+            key : Cache Key of the request body
+            body : Serialized request body
+            ttl : Cache TTL of the results (seconds)
+            timeout : Timeout (seconds)
+        """
+
+        async with self._limiter, self._semaphore:
+            response = await self._http.post("/search", content=body, headers=self._headers, timeout=timeout)
+        response.raise_for_status()
+        results = _trim_results(orjson.loads(response.content))
+
+        self._cache[key] = (time.monotonic() + ttl, results)
+        self._cache.move_to_end(key)
+        if len(self._cache) > CACHE_MAXSIZE:
+            self._cache.popitem(last=False)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Search returned %d hits", len(results.get("results", ())))
+
+        return results
@@ -3,9 +3,22 @@ Web Search Server based on Tavily API.
 """
 
 from src.mcp_servers.base_server import BaseMCPServer
-from src.mcp_servers.tavily_search.client import TavilySearchClient
+from src.mcp_servers.tavily_search.client import TavilySearchClient, aclose_tavily_http_client
 
-from typing import Any, Literal, Sequence, Union, cast
+import asyncio
+from typing import Annotated, Any, Literal, Sequence, Union
+
+from pydantic import Field
+
+# -----------------------------------------------------------
+# Shared Tool Parameter Types (one Literal object per type across all tools)
+# -----------------------------------------------------------
+SearchDepth = Literal["basic", "advanced"]
+Topic = Literal["general", "news", "finance"]
+TimeRange = Literal["day", "week", "month", "year"]
+IncludeAnswer = Union[bool, Literal["basic", "advanced"]]
+IncludeRawContent = Union[bool, Literal["markdown", "text"]]
+MaxResults = Annotated[int, Field(ge=1, le=100)] # range checked by tool argument validation
 
 class TavilyMCPServer(BaseMCPServer):
     """
@@ -13,23 +26,64 @@ class TavilyMCPServer(BaseMCPServer):
     """
 
     def _initialize_clients(self) -> None:
-        self.tavily_client = TavilySearchClient()
+        # created on first tool call (idle servers never build it)
+        self.tavily_client: TavilySearchClient | None = None
+
+    def _get_client(self) -> TavilySearchClient:
+        # construction has no await : no race between concurrent first calls on one event loop
+        if self.tavily_client is None:
+            self.tavily_client = TavilySearchClient()
+        return self.tavily_client
+
+    async def _close_clients(self) -> None:
+        # the pool is process-wide : closed once by the app lifespan, not per client
+        await aclose_tavily_http_client()
     
+    async def _do_search(self, func_name: str, query: str, **params: Any) -> dict[str, Any]:
+        """
+        Shared body of the search_* tools.
+
+        Args:
+            func_name : Name of the calling tool (for logs / error response)
+            query : Search Query
+            **params : Tavily search parameters (topic, search_depth, ...)
+        """
+        # empty / whitespace query : answer locally, no rate-limit slot or network call
+        if not query or query.isspace():
+            return self.create_error_response(
+                error=ValueError("Empty query"),
+                query=query,
+                func_name=func_name
+            )
+
+        try:
+            self.logger.info("Calling '%s' tool with query: '%s'", func_name, query)
+            result = await self._get_client().search(query=query, **params)
+            self.logger.info("%s results: %s", func_name, len(result.get("results", ())))
+            return result
+        except Exception as error:
+            self.logger.error("Error in '%s': %s", func_name, error)
+            return self.create_error_response(
+                error=error,
+                query=query,
+                func_name=func_name
+            )
+
     def _register_tools(self) -> None:
         @self.mcp.tool()
         async def search_web(
             query: str,
-            search_depth: Literal["basic", "advanced"] = "basic",
-            topic: Literal["general", "news", "finance" ] = "general",
-            time_range: Literal["day", "week", "month", "year"] = None,
+            search_depth: SearchDepth = "basic",
+            topic: Topic = "general",
+            time_range: TimeRange = None,
             start_date: str = None,
             end_date: str = None,
             days: int = None,
-            max_results: int = 5,
+            max_results: MaxResults = 5,
             include_domains: Sequence[str] = None,
             exclude_domains: Sequence[str] = None,
-            include_answer: Union[bool, Literal["basic", "advanced"]] = None,
-            include_raw_content: Union[bool, Literal["markdown", "text"]] = None,
+            include_answer: IncludeAnswer = None,
+            include_raw_content: IncludeRawContent = None,
             include_images: bool = None,
             timeout: int = 60,
             country: str = None,
@@ -54,48 +108,38 @@ class TavilyMCPServer(BaseMCPServer):
                 timeout : Timeout (seconds)
                 country : Country (ISO 3166-1 alpha-2)
             """
-            try:
-                self.logger.info(f"Calling 'search_web' tool with query: '{query}'")
-                result = await self.tavily_client.search(
-                    query=query,
-                    search_depth=search_depth,
-                    topic=topic,
-                    time_range=time_range,
-                    start_date=start_date,
-                    end_date=end_date,
-                    days=days,
-                    max_results=max_results,
-                    include_domains=include_domains,
-                    exclude_domains=exclude_domains,
-                    include_answer=include_answer,
-                    include_raw_content=include_raw_content,
-                    include_images=include_images,
-                    timeout=timeout,
-                    country=country,
-                )
-                self.logger.info(f"Search web results: {len(result)}")
-                return result
-            except Exception as error:
-                self.logger.error(f"Error in 'search_web': {error}")
-                return self.create_error_response(
-                    error=error, 
-                    query=query, 
-                    func_name="search_web"
-                )
+            return await self._do_search(
+                "search_web",
+                query=query,
+                search_depth=search_depth,
+                topic=topic,
+                time_range=time_range,
+                start_date=start_date,
+                end_date=end_date,
+                days=days,
+                max_results=max_results,
+                include_domains=include_domains,
+                exclude_domains=exclude_domains,
+                include_answer=include_answer,
+                include_raw_content=include_raw_content,
+                include_images=include_images,
+                timeout=timeout,
+                country=country,
+            )
         
         @self.mcp.tool()
         async def search_finance(
             query: str,
-            search_depth: Literal["basic", "advanced"] = "basic",
-            time_range: Literal["day", "week", "month", "year"] = None,
+            search_depth: SearchDepth = "basic",
+            time_range: TimeRange = None,
             start_date: str = None,
             end_date: str = None,
             days: int = None,
-            max_results: int = 5,
+            max_results: MaxResults = 5,
             include_domains: Sequence[str] = None,
             exclude_domains: Sequence[str] = None,
-            include_answer: Union[bool, Literal["basic", "advanced"]] = None,
-            include_raw_content: Union[bool, Literal["markdown", "text"]] = None,
+            include_answer: IncludeAnswer = None,
+            include_raw_content: IncludeRawContent = None,
             include_images: bool = None,
             timeout: int = 60,
             country: str = None,
@@ -119,48 +163,38 @@ class TavilyMCPServer(BaseMCPServer):
                 timeout : Timeout (seconds)
                 country : Country (ISO 3166-1 alpha-2)
             """
-            try:
-                self.logger.info(f"Calling 'search_finance' tool with query: '{query}'")
-                result = await self.tavily_client.search(
-                    query=query,
-                    search_depth=search_depth,
-                    topic='finance',
-                    time_range=time_range,
-                    start_date=start_date,
-                    end_date=end_date,
-                    days=days,
-                    max_results=max_results,
-                    include_domains=include_domains,
-                    exclude_domains=exclude_domains,
-                    include_answer=include_answer,
-                    include_raw_content=include_raw_content,
-                    include_images=include_images,
-                    timeout=timeout,
-                    country=country,
-                )
-                self.logger.info(f"Search finance results: {len(result)}")
-                return result
-            except Exception as error:
-                self.logger.error(f"Error in 'search_finance': {error}")
-                return self.create_error_response(
-                    error=error,
-                    query=query,
-                    func_name="search_finance"
-                )
+            return await self._do_search(
+                "search_finance",
+                query=query,
+                search_depth=search_depth,
+                topic='finance',
+                time_range=time_range,
+                start_date=start_date,
+                end_date=end_date,
+                days=days,
+                max_results=max_results,
+                include_domains=include_domains,
+                exclude_domains=exclude_domains,
+                include_answer=include_answer,
+                include_raw_content=include_raw_content,
+                include_images=include_images,
+                timeout=timeout,
+                country=country,
+            )
 
         @self.mcp.tool()
         async def search_news(
             query: str,
-            search_depth: Literal["basic", "advanced"] = "basic",
-            time_range: Literal["day", "week", "month", "year"] = None,
+            search_depth: SearchDepth = "basic",
+            time_range: TimeRange = None,
             start_date: str = None,
             end_date: str = None,
             days: int = None,
-            max_results: int = 5,
+            max_results: MaxResults = 5,
             include_domains: Sequence[str] = None,
             exclude_domains: Sequence[str] = None,
-            include_answer: Union[bool, Literal["basic", "advanced"]] = None,
-            include_raw_content: Union[bool, Literal["markdown", "text"]] = None,
+            include_answer: IncludeAnswer = None,
+            include_raw_content: IncludeRawContent = None,
             include_images: bool = None,
             timeout: int = 60,
             country: str = None,
@@ -184,34 +218,86 @@ class TavilyMCPServer(BaseMCPServer):
                 timeout : Timeout (seconds)
                 country : Country (ISO 3166-1 alpha-2)
             """
-            try:
-                self.logger.info(f"Calling 'search_news' tool with query: '{query}'")
-                result = await self.tavily_client.search(
-                    query=query,
-                    search_depth=search_depth,
-                    topic='news',
-                    time_range=time_range,
-                    start_date=start_date,
-                    end_date=end_date,
-                    days=days,
-                    max_results=max_results,
-                    include_domains=include_domains,
-                    exclude_domains=exclude_domains,
-                    include_answer=include_answer,
-                    include_raw_content=include_raw_content,
-                    include_images=include_images,
-                    timeout=timeout,
-                    country=country,
-                )
-                self.logger.info(f"Search news results: {len(result)}")
-                return result
-            except Exception as error:
-                self.logger.error(f"Error in 'search_news': {error}")
-                return self.create_error_response(
-                    error=error,
-                    query=query,
-                    func_name="search_news"
-                )
+            return await self._do_search(
+                "search_news",
+                query=query,
+                search_depth=search_depth,
+                topic='news',
+                time_range=time_range,
+                start_date=start_date,
+                end_date=end_date,
+                days=days,
+                max_results=max_results,
+                include_domains=include_domains,
+                exclude_domains=exclude_domains,
+                include_answer=include_answer,
+                include_raw_content=include_raw_content,
+                include_images=include_images,
+                timeout=timeout,
+                country=country,
+            )
+
+        @self.mcp.tool()
+        async def search_all(
+            query: str,
+            search_depth: SearchDepth = "basic",
+            time_range: TimeRange = None,
+            start_date: str = None,
+            end_date: str = None,
+            days: int = None,
+            max_results: MaxResults = 5,
+            include_domains: Sequence[str] = None,
+            exclude_domains: Sequence[str] = None,
+            include_answer: IncludeAnswer = None,
+            include_raw_content: IncludeRawContent = None,
+            include_images: bool = None,
+            timeout: int = 60,
+            country: str = None,
+        ):
+            """
+            Search Web, News and Finance concurrently with Tavily API (one call instead of three).
+
+            Args:
+                query : Search Query
+                search_depth : Search Depth (basic, advanced)
+                time_range : Search Time Range (day, week, month, year)
+                start_date : Start Date (YYYY-MM-DD)
+                end_date : End Date (YYYY-MM-DD)
+                days : Search Days (1-30)
+                max_results : Maximum Results per Topic (1-100)
+                include_domains : Include Domains (List of Strings)
+                exclude_domains : Exclude Domains (List of Strings)
+                include_answer : Include Answer (True, False)
+                include_raw_content : Include Raw Content (True, False)
+                include_images : Include Images (True, False)
+                timeout : Timeout (seconds)
+                country : Country (ISO 3166-1 alpha-2)
+
+            Returns:
+                {"web": ..., "news": ..., "finance": ...} (failed topics hold an error response)
+            """
+            params = dict(
+                search_depth=search_depth,
+                time_range=time_range,
+                start_date=start_date,
+                end_date=end_date,
+                days=days,
+                max_results=max_results,
+                include_domains=include_domains,
+                exclude_domains=exclude_domains,
+                include_answer=include_answer,
+                include_raw_content=include_raw_content,
+                include_images=include_images,
+                timeout=timeout,
+                country=country,
+            )
+            # total latency is max() of the three searches, not sum()
+            web, news, finance = await asyncio.gather(
+                self._do_search("search_all", query=query, topic="general", **params),
+                self._do_search("search_all", query=query, topic="news", **params),
+                self._do_search("search_all", query=query, topic="finance", **params),
+            )
+            return {"web": web, "news": news, "finance": finance}
 
 def create_app() -> Any:
     server = TavilyMCPServer(
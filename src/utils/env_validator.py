@@ -1,9 +1,8 @@
-from argparse import OPTIONAL
-from dataclasses import dataclass
 import os
-from enum import Enum
-from typing import Optional, Dict, List, Any
-    
+from functools import lru_cache
 
+# values are read from os.environ once per (key, default) and reused
+# (env changes after the first read are not seen : fine for server processes)
+@lru_cache(maxsize=None)
 def get_env_variable(key: str, default: str | None = None) -> str:
-    return os.getenv(key, default)
\ No newline at end of file
+    return os.getenv(key, default)
@@ -1,4 +1,3 @@
-import asyncio
 import sys
 import os
 from dotenv import load_dotenv
@@ -9,6 +8,7 @@ sys.path.insert(0, project_root)
 
 from src.agents.tavily.tavily_search_agent import TavilySearchAgent
 from src.agents.tavily.tavily_search_agent import create_run_config
+from src.agents.base.base_agent import SHARED_HTTP_CLIENT, aclose_shared_http_client
 from langchain_core.messages import (
     HumanMessage,
     AIMessage
@@ -20,6 +20,12 @@ sys.path.append(PROJECT_ROOT)
 
 load_dotenv(os.path.join(PROJECT_ROOT, ".env"))
 
+# libuv-based event loop when available
+try:
+    from uvloop import run
+except ImportError:
+    from asyncio import run
+
 
 async def main():
     print("Starting Tavily Search Agent Experiment...")
@@ -27,9 +33,14 @@ async def main():
     try:
         print("Creating Tavily Search Agent...")
         agent = await TavilySearchAgent.create(
-            model=ChatOpenAI(model="gpt-4o", temperature=0),
+            model=ChatOpenAI(
+                model="gpt-4o",
+                temperature=0,
+                http_async_client=SHARED_HTTP_CLIENT,
+            ),
             agent_name="TavilySearchAgent",
         )
+        await agent.warmup()
         print("Agent created successfully!")
     except Exception as e:
         print(f"Failed to create agent: {e}")
@@ -85,9 +96,12 @@ async def main():
             traceback.print_exc()
             continue
 
+    await agent.aclose()
+    await aclose_shared_http_client()
+
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        run(main())
     except KeyboardInterrupt:
         print("Shutdown Program by User")
     except Exception as error:
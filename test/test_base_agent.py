@@ -0,0 +1,68 @@
+import os
+import sys
+import unittest
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+
+from src.agents.simple.simple_chat_agent import (
+    SimpleLangGraphChatAgent,
+    StateSchema,
+    InputSchema,
+    OutputSchema,
+)
+
+
+def create_agent(responses: list[str]) -> SimpleLangGraphChatAgent:
+    return SimpleLangGraphChatAgent(
+        model=FakeListChatModel(responses=responses),
+        state_schema=StateSchema,
+        input_schema=InputSchema,
+        output_schema=OutputSchema,
+    )
+
+
+class BoundGraphRunConfigTest(unittest.IsolatedAsyncioTestCase):
+    """
+    Graph bound to an agent must keep dispatching to it when callers pass their own run config
+    """
+
+    RUN_CONFIG = {
+        "run_name": "test",
+        "tags": ["test"],
+        "configurable": {"run_id": "x"},
+    }
+
+    async def test_ainvoke_with_run_config(self):
+        agent = create_agent(["hello"])
+        result = await agent.graph.ainvoke({"query": "q"}, self.RUN_CONFIG)
+        self.assertEqual(result, {"generation": "hello"})
+
+    async def test_astream_with_run_config(self):
+        agent = create_agent(["hello"])
+        chunks = [chunk async for chunk in agent.graph.astream({"query": "q"}, self.RUN_CONFIG)]
+        self.assertEqual(chunks[-1]["generate"]["generation"], "hello")
+
+    async def test_abatch_with_per_input_run_configs(self):
+        agent = create_agent(["first", "second"])
+        results = await agent.graph.abatch(
+            [{"query": "1"}, {"query": "2"}],
+            [self.RUN_CONFIG, self.RUN_CONFIG],
+            max_concurrency=1,
+        )
+        self.assertEqual(results, [{"generation": "first"}, {"generation": "second"}])
+
+    async def test_shared_compiled_graph_dispatches_to_own_agent(self):
+        first = create_agent(["from first"])
+        second = create_agent(["from second"])
+        self.assertIs(first.graph.bound, second.graph.bound)
+
+        result = await second.graph.ainvoke({"query": "q"}, self.RUN_CONFIG)
+        self.assertEqual(result, {"generation": "from second"})
+
+
+if __name__ == "__main__":
+    unittest.main()